@@ -20,21 +20,30 @@ def generate_insurance_demo_data(insurance_data, policyholders, agents):
     """
     
     spark = insurance_data.spark
+    # Dimension tables are tiny; let downstream joins against them broadcast instead of shuffle
+    spark.conf.set("spark.sql.autoBroadcastJoinThreshold", 50 * 1024 * 1024)
+    # < 2000 rows in total: avoid hundreds of near-empty shuffle partitions / files
+    spark.conf.set("spark.sql.shuffle.partitions", 8)
+    spark.conf.set("spark.databricks.delta.optimizeWrite.enabled", "true")
+    spark.conf.set("spark.databricks.delta.autoCompact.enabled", "true")
     
     # 1. Generate AGENTS (50 unique)
     agents_df = spark.range(50).select(
-        F.lit(f"AGENT_{F.col('id')}").alias("agentId"),
+        F.concat(F.lit("AGENT_"), F.col("id").cast("string")).alias("agentId"),
         F.expr("concat('Agent ', id + 1)").alias("name"),
-        F.choice([F.lit("Senior"), F.lit("Junior"), F.lit("Manager")]).alias("level"),
+        F.element_at(
+            F.array(F.lit("Senior"), F.lit("Junior"), F.lit("Manager")),
+            (F.rand() * 3 + 1).cast("int")
+        ).alias("level"),
         F.round(F.rand() * 1000000, 2).alias("commissionYTD"),
         F.lit("Active").alias("status")
     )
-    agents_df.write.mode("overwrite").saveAsTable("agents")
+    agents_df.coalesce(1).write.mode("overwrite").saveAsTable("agents")
     
     # 2. Generate POLICYHOLDERS (200 unique with agent assignments)
     policyholders_df = spark.range(200).select(
-        F.lit(f"PH_{F.col('id')}").alias("policyholderId"),
-        F.expr("concat(first_name(), ' ', last_name())").alias("name"),
+        F.concat(F.lit("PH_"), F.col("id").cast("string")).alias("policyholderId"),
+        F.expr("concat('Policyholder ', id + 1)").alias("name"),
         F.lit("Individual").alias("type"),
         F.round(F.rand() * 50000 + 25000, 2).alias("annualIncome"),
         F.date_add(F.lit(datetime(1980,1,1)), (F.col("id") * 100).cast("int")).alias("birthDate"),
@@ -44,41 +53,49 @@ def generate_insurance_demo_data(insurance_data, policyholders, agents):
          .when((F.col("id") >= 40) & (F.col("id") < 80), F.lit("AGENT_1"))
          .when((F.col("id") >= 80) & (F.col("id") < 120), F.lit("AGENT_2"))
          .otherwise(F.expr("concat('AGENT_', floor(rand()*47)+3)")).alias("primaryAgent")
-    )
-    policyholders_df.write.mode("overwrite").saveAsTable("policyholders")
+    ).cache()  # claims join against these exact rows below
+    policyholders_df.coalesce(1).write.mode("overwrite").saveAsTable("policyholders")
     
     # 3. Generate INSURANCE CLAIMS (1500 records with fraud patterns)
+    # Draw each random column once per row so every CASE below reuses it
     claims_df = spark.range(1500).select(
-        F.lit(f"CLAIM_{F.col('id')}").alias("claimId"),
+        "id",
+        F.rand().alias("r_amount"),
+        F.rand().alias("r_status"),
+        F.rand().alias("r_anomaly"),
+        F.rand().alias("r_policyholder")
+    ).select(
+        F.concat(F.lit("CLAIM_"), F.col("id").cast("string")).alias("claimId"),
         # Fraud cluster 1: High-value claims via AGENT_0 (claims 0-299)
-        F.when(F.col("id") < 300, F.round(F.rand() * 50000 + 25000, 2))  # $25k-$75k
-         .when((F.col("id") >= 300) & (F.col("id") < 600), F.round(F.rand() * 15000 + 5000, 2))  # $5k-$20k
-         .otherwise(F.round(F.rand() * 5000 + 500, 2)).alias("claimAmount"),  # <$5k
+        F.expr("""CASE WHEN id < 300 THEN round(r_amount * 50000 + 25000, 2)
+                       WHEN id < 600 THEN round(r_amount * 15000 + 5000, 2)
+                       ELSE round(r_amount * 5000 + 500, 2) END""").alias("claimAmount"),  # $25k-$75k / $5k-$20k / <$5k
         
         # Claim status with fraud progression
-        F.when(F.col("id") < 100, "Under Investigation")  # Fraud cluster
-         .when((F.col("id") >= 100) & (F.col("id") < 250), "Pending Review")
-         .when(F.rand() < 0.05, "Denied")  # 5% denial rate
-         .otherwise("Approved").alias("status"),
+        F.expr("""CASE WHEN id < 100 THEN 'Under Investigation'
+                       WHEN id < 250 THEN 'Pending Review'
+                       WHEN r_status < 0.05 THEN 'Denied'
+                       ELSE 'Approved' END""").alias("status"),  # 5% denial rate
         
         # Anomaly score (0-100) - higher = more suspicious
-        F.when(F.col("id") < 300, F.round(F.rand() * 40 + 60, 1))  # Fraud cluster: 60-100
-         .when((F.col("id") >= 300) & (F.col("id") < 600), F.round(F.rand() * 30 + 20, 1))  # 20-50
-         .otherwise(F.round(F.rand() * 20, 1)).alias("anomalyScore"),  # 0-20
+        F.expr("""CASE WHEN id < 300 THEN round(r_anomaly * 40 + 60, 1)
+                       WHEN id < 600 THEN round(r_anomaly * 30 + 20, 1)
+                       ELSE round(r_anomaly * 20, 1) END""").alias("anomalyScore"),  # 60-100 / 20-50 / 0-20
         
         # Link to policyholder (create dense connections for demo)
-        F.when(F.col("id") < 40, F.lit("PH_0"))
-         .when((F.col("id") >= 40) & (F.col("id") < 80), F.lit("PH_1"))
-         .when((F.col("id") >= 80) & (F.col("id") < 120), F.lit("PH_2"))
-         .otherwise(F.expr("concat('PH_', floor(rand()*197)+3)")).alias("policyholderId"),
+        F.expr("""CASE WHEN id < 40 THEN 'PH_0'
+                       WHEN id < 80 THEN 'PH_1'
+                       WHEN id < 120 THEN 'PH_2'
+                       ELSE concat('PH_', floor(r_policyholder * 197) + 3) END""").alias("policyholderId"),
         
         # Claim date (recent 6 months)
         F.date_sub(F.current_date(), (F.col("id") % 180).cast("int")).alias("claimDate"),
         
         # Fraud indicators
-        F.choice([
-            F.lit("Auto"), F.lit("Home"), F.lit("Health"), F.lit("Liability")
-        ]).alias("claimType"),
+        F.element_at(
+            F.array(F.lit("Auto"), F.lit("Home"), F.lit("Health"), F.lit("Liability")),
+            (F.rand() * 4 + 1).cast("int")
+        ).alias("claimType"),
         
         F.when(F.rand() < 0.15, True).otherwise(False).alias("multipleClaimsSameDay"),
         F.when(F.rand() < 0.08, True).otherwise(False).alias("sameAddressMultiplePolicies"),
@@ -95,21 +112,36 @@ def generate_insurance_demo_data(insurance_data, policyholders, agents):
                  F.lit(" - Reported "),
                  F.to_date(F.col("claimDate"), "yyyy-MM-dd")))
     
+    # Resolve each claim's agent through its policyholder (broadcast the small side)
+    claims_cols = claims_final.columns
+    claims_final = claims_final.join(
+        F.broadcast(policyholders_df.select("policyholderId", F.col("primaryAgent").alias("agentId"))),
+        "policyholderId",
+        "left"
+    ).select(*claims_cols, "agentId")  # keep claimId first; the join moves the key to the front
+    
+    # Materialize once so the write and the stats below see the same random draws
+    claims_final = claims_final.cache()
+    claims_count = claims_final.count()
+    
     # Write outputs
-    claims_final.write.mode("overwrite").saveAsTable("insurance_claims")
-    policyholders_df.write.mode("overwrite").saveAsTable("policyholders")
-    agents_df.write.mode("overwrite").saveAsTable("agents")
+    claims_final.coalesce(1).write.mode("overwrite").saveAsTable("insurance_claims")
     
     # Demo-ready summary stats
     print("🚀 Demo Data Generated Successfully!")
-    print(f"📊 {claims_final.count()} claims created")
+    print(f"📊 {claims_count} claims created")
     print(f"👥 {policyholders_df.count()} policyholders")
     print(f"👨‍💼 {agents_df.count()} agents")
     print("\n🔍 Key Demo Features:")
-    claims_final.groupBy("status").count().orderBy(F.desc("count")).show()
-    claims_final.select(F.round(F.avg("claimAmount"), 2).alias("avg"), 
-                       F.round(F.max("claimAmount"), 2).alias("max"),
-                       F.round(F.avg("anomalyScore"), 2).alias("avg_anomaly")).show()
+    claims_final.groupBy("status").agg(
+        F.count("*").alias("count"),
+        F.round(F.avg("claimAmount"), 2).alias("avg"),
+        F.round(F.max("claimAmount"), 2).alias("max"),
+        F.round(F.avg("anomalyScore"), 2).alias("avg_anomaly")
+    ).orderBy(F.desc("count")).show()
+    
+    claims_final.unpersist()
+    policyholders_df.unpersist()
 
 # BONUS: Quick Ontology write function (run in Code Workbook)
 def create_object_sets():
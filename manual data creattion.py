@@ -7,51 +7,57 @@ Perfect for quick demo setup without Foundry transforms.
 import pandas as pd
 import numpy as np
 from faker import Faker
-import random
-from datetime import datetime, timedelta
 import os
 
-fake = Faker()
-np.random.seed(42)
-random.seed(42)
-
 # Configuration for extensive demo
 NUM_AGENTS = 50
 NUM_POLICYHOLDERS = 200
 NUM_CLAIMS = 1500
+RANDOM_SEED = 42
+
+# Single seeded generator shared by all helpers; Faker only for realistic text fields
+RNG = np.random.default_rng(RANDOM_SEED)
+Faker.seed(RANDOM_SEED)
+fake = Faker()
 
-def generate_agents():
+def generate_agents(rng=RNG):
     """Generate 50 insurance agents with realistic data"""
     agents = []
     for i in range(NUM_AGENTS):
         agent = {
             'agentId': f'AGENT_{i}',
-            'name': f'Agent {i+1} {"Smith"| "Johnson"| "Brown"| "Davis"| "Miller"}',
-            'level': np.random.choice(['Senior', 'Junior', 'Manager'], p=[0.3, 0.5, 0.2]),
-            'commissionYTD': round(np.random.uniform(50000, 250000), 2),
+            'name': f'Agent {i+1} {rng.choice(["Smith", "Johnson", "Brown", "Davis", "Miller"])}',
+            'level': rng.choice(['Senior', 'Junior', 'Manager'], p=[0.3, 0.5, 0.2]),
+            'commissionYTD': round(rng.uniform(50000, 250000), 2),
             'status': 'Active',
-            'region': np.random.choice(['North', 'South', 'East', 'West'])
+            'region': rng.choice(['North', 'South', 'East', 'West'])
         }
         agents.append(agent)
     return pd.DataFrame(agents)
 
-def generate_policyholders():
+def generate_policyholders(rng=RNG):
     """Generate 200 policyholders with fraud clustering"""
     policyholders = []
+    # Ages 25-75 (calendar bounds, like Faker's date_of_birth), drawn in one vectorized pass
+    today = pd.Timestamp.today().normalize()
+    oldest = today - pd.DateOffset(years=76) + pd.Timedelta(days=1)
+    youngest = today - pd.DateOffset(years=25)
+    birth_dates = oldest + pd.to_timedelta(
+        rng.integers(0, (youngest - oldest).days + 1, size=NUM_POLICYHOLDERS), unit='D')
     for i in range(NUM_POLICYHOLDERS):
         # Fraud clusters: first 120 tied to suspicious agents
         primary_agent = ('AGENT_0' if i < 40 else 
                         'AGENT_1' if i < 80 else 
                         'AGENT_2' if i < 120 else 
-                        f'AGENT_{random.randint(3, NUM_AGENTS-1)}')
+                        f'AGENT_{rng.integers(3, NUM_AGENTS)}')
         
         ph = {
             'policyholderId': f'PH_{i}',
             'name': fake.name(),
-            'type': np.random.choice(['Individual', 'Family', 'Business'], p=[0.7, 0.25, 0.05]),
-            'annualIncome': round(np.random.normal(75000, 25000), 2),
-            'birthDate': fake.date_of_birth(minimum_age=25, maximum_age=75).strftime('%Y-%m-%d'),
-            'riskProfile': 'High Risk' if np.random.random() < 0.12 else 'Standard',
+            'type': rng.choice(['Individual', 'Family', 'Business'], p=[0.7, 0.25, 0.05]),
+            'annualIncome': round(rng.normal(75000, 25000), 2),
+            'birthDate': birth_dates[i],
+            'riskProfile': 'High Risk' if rng.random() < 0.12 else 'Standard',
             'primaryAgent': primary_agent,
             'address': fake.address().replace('\n', ', '),
             'phone': fake.phone_number()
@@ -59,50 +65,60 @@ def generate_policyholders():
         policyholders.append(ph)
     return pd.DataFrame(policyholders)
 
-def generate_claims(policyholders_df):
+def generate_claims(policyholders_df, rng=RNG):
     """Generate 1500 claims with sophisticated fraud patterns"""
-    claims = []
-    
-    for i in range(NUM_CLAIMS):
-        # Fraud Cluster 1: High-value claims (0-299)
-        if i < 300:
-            claim_amount = round(np.random.uniform(25000, 75000), 2)
-            anomaly_score = round(np.random.uniform(60, 100), 1)
-            status = np.random.choice(['Under Investigation', 'Pending Review', 'Approved'], p=[0.4, 0.4, 0.2])
-        # Fraud Cluster 2: Medium suspicious (300-599)
-        elif i < 600:
-            claim_amount = round(np.random.uniform(5000, 20000), 2)
-            anomaly_score = round(np.random.uniform(20, 50), 1)
-            status = np.random.choice(['Pending Review', 'Approved', 'Denied'], p=[0.5, 0.4, 0.1])
-        # Normal claims
-        else:
-            claim_amount = round(np.random.uniform(500, 5000), 2)
-            anomaly_score = round(np.random.uniform(0, 20), 1)
-            status = np.random.choice(['Approved', 'Denied'], p=[0.9, 0.1])
-        
-        # Link to policyholder (dense connections for network demo)
-        ph_idx = min(i % len(policyholders_df), len(policyholders_df)-1)
-        policyholder_id = policyholders_df.iloc[ph_idx]['policyholderId']
-        
-        claim_date = (datetime.now() - timedelta(days=random.randint(0, 180))).strftime('%Y-%m-%d')
-        
-        claim = {
-            'claimId': f'CLAIM_{i}',
-            'policyholderId': policyholder_id,
-            'claimAmount': claim_amount,
-            'status': status,
-            'anomalyScore': anomaly_score,
-            'claimDate': claim_date,
-            'claimType': np.random.choice(['Auto', 'Home', 'Health', 'Liability']),
-            'multipleClaimsSameDay': np.random.random() < 0.15,
-            'sameAddressMultiplePolicies': np.random.random() < 0.08,
-            'processingDays': round(np.random.uniform(1, 45), 1),
-            'description': f"{'Vehicle collision' if claim['claimType']=='Auto' else 'Home damage' if claim['claimType']=='Home' else 'Medical emergency' if claim['claimType']=='Health' else 'Property liability'} - Filed {claim_date}",
-            'agentId': policyholders_df.iloc[ph_idx]['primaryAgent']
-        }
-        claims.append(claim)
-    
-    return pd.DataFrame(claims)
+    claim_idx = np.arange(NUM_CLAIMS)
+    # Fraud Cluster 1: High-value claims (0-299)
+    # Fraud Cluster 2: Medium suspicious (300-599)
+    # Normal claims (600+)
+    cluster1 = claim_idx < 300
+    cluster2 = (claim_idx >= 300) & (claim_idx < 600)
+    normal = claim_idx >= 600
+
+    claim_amounts = np.round(rng.uniform(
+        np.select([cluster1, cluster2], [25000, 5000], 500),
+        np.select([cluster1, cluster2], [75000, 20000], 5000)), 2)
+    anomaly_scores = np.round(rng.uniform(
+        np.select([cluster1, cluster2], [60, 20], 0),
+        np.select([cluster1, cluster2], [100, 50], 20)), 1)
+
+    statuses = np.empty(NUM_CLAIMS, dtype=object)
+    statuses[cluster1] = rng.choice(['Under Investigation', 'Pending Review', 'Approved'],
+                                    size=cluster1.sum(), p=[0.4, 0.4, 0.2])
+    statuses[cluster2] = rng.choice(['Pending Review', 'Approved', 'Denied'],
+                                    size=cluster2.sum(), p=[0.5, 0.4, 0.1])
+    statuses[normal] = rng.choice(['Approved', 'Denied'], size=normal.sum(), p=[0.9, 0.1])
+
+    # Link to policyholder (dense connections for network demo)
+    ph_ids = policyholders_df['policyholderId'].to_numpy()
+    ph_agents = policyholders_df['primaryAgent'].to_numpy()
+    ph_idx = claim_idx % len(ph_ids)
+    policyholder_ids = ph_ids[ph_idx]
+    agent_ids = ph_agents[ph_idx]
+
+    claim_dates = (pd.Timestamp.today().normalize() - pd.to_timedelta(
+        rng.integers(0, 181, size=NUM_CLAIMS), unit='D')).strftime('%Y-%m-%d')
+
+    claim_types = rng.choice(['Auto', 'Home', 'Health', 'Liability'], size=NUM_CLAIMS)
+    descriptions = np.select(
+        [claim_types == 'Auto', claim_types == 'Home', claim_types == 'Health'],
+        ['Vehicle collision', 'Home damage', 'Medical emergency'],
+        default='Property liability')
+
+    return pd.DataFrame({
+        'claimId': np.char.add('CLAIM_', claim_idx.astype(str)),
+        'policyholderId': policyholder_ids,
+        'claimAmount': claim_amounts,
+        'status': statuses,
+        'anomalyScore': anomaly_scores,
+        'claimDate': claim_dates,
+        'claimType': claim_types,
+        'multipleClaimsSameDay': rng.random(NUM_CLAIMS) < 0.15,
+        'sameAddressMultiplePolicies': rng.random(NUM_CLAIMS) < 0.08,
+        'processingDays': np.round(rng.uniform(1, 45, size=NUM_CLAIMS), 1),
+        'description': pd.Series(descriptions) + ' - Filed ' + claim_dates,
+        'agentId': agent_ids
+    })
 
 def create_demo_files():
     """Generate all CSV files in ./foundry_demo_data/ folder"""
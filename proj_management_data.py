@@ -1,110 +1,168 @@
-import random
-import uuid
-from datetime import datetime, timedelta
+import os
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # ------------ Config ------------
 N_PROJECTS = 10
 TASKS_PER_PROJECT_MIN = 20
 TASKS_PER_PROJECT_MAX = 60
 RANDOM_SEED = 42
+N_JOBS = 1  # worker processes for task generation (-1 = all cores)
 # --------------------------------
 
-random.seed(RANDOM_SEED)
+RNG = np.random.default_rng(RANDOM_SEED)
 
 PROJECT_STATUSES = ["On Track", "At Risk", "Delayed", "Completed"]
 TASK_STATUSES = ["Not Started", "In Progress", "Blocked", "Completed"]
 PRIORITIES = ["Low", "Medium", "High", "Critical"]
 ROLES = ["Developer", "Analyst", "PM", "QA", "DevOps"]
-
-def random_date(start: datetime, end: datetime) -> datetime:
-    """Pick a random datetime between start and end."""
-    delta = end - start
-    offset_days = random.randint(0, delta.days)
-    return start + timedelta(days=offset_days)
-
-def generate_projects(n_projects: int):
-    projects = []
-    base_start = datetime(2024, 1, 1)
-    base_end = datetime(2026, 12, 31)
-
-    for i in range(n_projects):
-        project_id = str(uuid.uuid4())
-        start_date = random_date(base_start, base_end - timedelta(days=180))
-        end_date = start_date + timedelta(days=random.randint(60, 365))
-        status = random.choices(
-            PROJECT_STATUSES,
-            weights=[0.5, 0.2, 0.2, 0.1],  # more "On Track"
-            k=1
-        )[0]
-        budget = random.randint(200_000, 5_000_000)
-
-        projects.append({
-            "project_id": project_id,
-            "project_name": f"Project {i+1}",
-            "owner": f"PM_{i+1}",
-            "status": status,
-            "start_date": start_date.date().isoformat(),
-            "end_date": end_date.date().isoformat(),
-            "budget_usd": budget
-        })
-
-    return pd.DataFrame(projects)
-
-def generate_tasks(projects_df: pd.DataFrame):
-    tasks = []
-    task_counter = 1
-
-    for _, row in projects_df.iterrows():
-        n_tasks = random.randint(TASKS_PER_PROJECT_MIN, TASKS_PER_PROJECT_MAX)
-        project_start = datetime.fromisoformat(row["start_date"])
-        project_end = datetime.fromisoformat(row["end_date"])
-
-        for _ in range(n_tasks):
-            task_id = str(uuid.uuid4())
-            assignee_id = random.randint(1, 30)
-            assignee = f"User_{assignee_id}"
-            role = random.choice(ROLES)
-
-            start_date = random_date(project_start, project_end - timedelta(days=7))
-            duration_days = random.randint(3, 45)
-            planned_end = start_date + timedelta(days=duration_days)
-
-            # introduce random delays
-            delay_days = max(0, int(random.gauss(0, 3)))
-            actual_end = planned_end + timedelta(days=delay_days)
-
-            status = random.choices(
-                TASK_STATUSES,
-                weights=[0.2, 0.4, 0.1, 0.3],
-                k=1
-            )[0]
-
-            priority = random.choices(
-                PRIORITIES,
-                weights=[0.3, 0.4, 0.2, 0.1],
-                k=1
-            )[0]
-
-            tasks.append({
-                "task_id": task_id,
-                "task_name": f"Task {task_counter}",
-                "project_id": row["project_id"],
-                "assignee": assignee,
-                "role": role,
-                "status": status,
-                "priority": priority,
-                "start_date": start_date.date().isoformat(),
-                "planned_end_date": planned_end.date().isoformat(),
-                "actual_end_date": actual_end.date().isoformat(),
-                "estimated_hours": random.randint(4, 160),
-                "logged_hours": max(0, int(random.gauss(40, 20))),
-                "delay_days": delay_days
-            })
-            task_counter += 1
-
-    return pd.DataFrame(tasks)
+ASSIGNEES = [f"User_{i}" for i in range(1, 31)]
+
+PROJECT_STATUS_WEIGHTS = [0.5, 0.2, 0.2, 0.1]  # more "On Track"
+TASK_STATUS_WEIGHTS = [0.2, 0.4, 0.1, 0.3]
+PRIORITY_WEIGHTS = [0.3, 0.4, 0.2, 0.1]
+
+def random_dates(start, end, rng: np.random.Generator, size=None) -> np.ndarray:
+    """Pick random days between start and end (inclusive) as datetime64[D]."""
+    start = np.asarray(start, dtype="datetime64[D]")
+    end = np.asarray(end, dtype="datetime64[D]")
+    offset_days = rng.integers(0, (end - start).astype(np.int64) + 1, size=size)
+    return start + offset_days
+
+def weighted_codes(weights, size: int, rng: np.random.Generator) -> np.ndarray:
+    """Sample `size` category codes according to `weights`."""
+    cum_weights = np.cumsum(weights, dtype=np.float64)
+    cum_weights /= cum_weights[-1]
+    return np.searchsorted(cum_weights, rng.random(size), side="right").astype(np.int8)
+
+def generate_projects(n_projects: int, rng: np.random.Generator = RNG):
+    base_start = np.datetime64("2024-01-01")
+    base_end = np.datetime64("2026-12-31")
+
+    project_ids = np.arange(1, n_projects + 1, dtype=np.int64)
+    start_dates = random_dates(base_start, base_end - 180, rng, size=n_projects)
+    end_dates = start_dates + rng.integers(60, 366, size=n_projects)
+    statuses = pd.Categorical.from_codes(
+        weighted_codes(PROJECT_STATUS_WEIGHTS, n_projects, rng),
+        categories=PROJECT_STATUSES
+    )
+    budgets = rng.integers(200_000, 5_000_001, size=n_projects, dtype=np.int64)
+
+    return pd.DataFrame({
+        "project_id": project_ids,
+        "project_name": np.char.add("Project ", project_ids.astype(str)),
+        "owner": np.char.add("PM_", project_ids.astype(str)),
+        "status": statuses,
+        "start_date": start_dates,
+        "end_date": end_dates,
+        "budget_usd": budgets
+    })
+
+def _generate_task_block(
+    projects_df: pd.DataFrame,
+    n_tasks: np.ndarray,
+    first_task_id: int,
+    rng: np.random.Generator
+) -> pd.DataFrame:
+    """Generate the tasks for a block of projects, numbered from first_task_id."""
+    total = int(n_tasks.sum())
+
+    starts = pd.to_datetime(projects_df["start_date"]).to_numpy().astype("datetime64[D]")
+    ends = pd.to_datetime(projects_df["end_date"]).to_numpy().astype("datetime64[D]")
+    # last possible task start is a week before the project ends
+    latest_starts = np.maximum(ends - 7, starts)
+
+    # expand project-level columns to one entry per task
+    project_ids = np.repeat(projects_df["project_id"].to_numpy(), n_tasks)
+    project_start = np.repeat(starts, n_tasks)
+    project_latest_start = np.repeat(latest_starts, n_tasks)
+
+    task_ids = np.arange(first_task_id, first_task_id + total, dtype=np.int64)
+    assignees = pd.Categorical.from_codes(
+        rng.integers(0, len(ASSIGNEES), size=total, dtype=np.int8), categories=ASSIGNEES
+    )
+    roles = pd.Categorical.from_codes(
+        rng.integers(0, len(ROLES), size=total, dtype=np.int8), categories=ROLES
+    )
+
+    start_date = random_dates(project_start, project_latest_start, rng)
+    duration_days = rng.integers(3, 46, size=total)
+    planned_end = start_date + duration_days
+
+    # introduce random delays
+    delay_days = np.clip(rng.normal(0.0, 3.0, size=total).astype(np.int32), 0, None)
+    actual_end = planned_end + delay_days
+
+    statuses = pd.Categorical.from_codes(
+        weighted_codes(TASK_STATUS_WEIGHTS, total, rng),
+        categories=TASK_STATUSES
+    )
+    priorities = pd.Categorical.from_codes(
+        weighted_codes(PRIORITY_WEIGHTS, total, rng),
+        categories=PRIORITIES
+    )
+
+    estimated_hours = rng.integers(4, 161, size=total, dtype=np.int32)
+    logged_hours = np.clip(rng.normal(40.0, 20.0, size=total).astype(np.int32), 0, None)
+
+    return pd.DataFrame({
+        "task_id": task_ids,
+        "task_name": np.char.add("Task ", task_ids.astype(str)),
+        "project_id": project_ids,
+        "assignee": assignees,
+        "role": roles,
+        "status": statuses,
+        "priority": priorities,
+        "start_date": start_date,
+        "planned_end_date": planned_end,
+        "actual_end_date": actual_end,
+        "estimated_hours": estimated_hours,
+        "logged_hours": logged_hours,
+        "delay_days": delay_days
+    })
+
+def generate_tasks(
+    projects_df: pd.DataFrame,
+    n_jobs: int = N_JOBS,
+    rng: np.random.Generator = RNG
+):
+    n_tasks = rng.integers(
+        TASKS_PER_PROJECT_MIN, TASKS_PER_PROJECT_MAX + 1, size=len(projects_df)
+    )
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs <= 1:
+        return _generate_task_block(projects_df, n_tasks, 1, rng)
+
+    # projects are independent: split them into contiguous blocks, each with
+    # its own child RNG stream, and keep task ids globally sequential
+    blocks = [b for b in np.array_split(np.arange(len(projects_df)), n_jobs) if len(b)]
+    first_task_ids = np.cumsum(n_tasks) - n_tasks + 1
+    with ProcessPoolExecutor(max_workers=len(blocks)) as pool:
+        task_blocks = pool.map(
+            _generate_task_block,
+            [projects_df.iloc[b] for b in blocks],
+            [n_tasks[b] for b in blocks],
+            [int(first_task_ids[b[0]]) for b in blocks],
+            rng.spawn(len(blocks))
+        )
+        return pd.concat(task_blocks, ignore_index=True)
+
+def write_parquet(df: pd.DataFrame, path: str):
+    """Write df as snappy Parquet, storing datetime columns as date32."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema = pa.schema(
+        [
+            field.with_type(pa.date32()) if pa.types.is_timestamp(field.type) else field
+            for field in table.schema
+        ],
+        metadata=table.schema.metadata
+    )
+    pq.write_table(table.cast(schema), path, compression="snappy")
 
 def main():
     projects_df = generate_projects(N_PROJECTS)
@@ -115,10 +173,10 @@ def main():
     print("\nTasks sample:")
     print(tasks_df.head())
 
-    # Save to CSV for Foundry upload / pipelines
-    projects_df.to_csv("projects_mock.csv", index=False)
-    tasks_df.to_csv("tasks_mock.csv", index=False)
-    print("\nSaved projects_mock.csv and tasks_mock.csv")
+    # Save to Parquet for Foundry upload / pipelines
+    write_parquet(projects_df, "projects_mock.parquet")
+    write_parquet(tasks_df, "tasks_mock.parquet")
+    print("\nSaved projects_mock.parquet and tasks_mock.parquet")
 
 if __name__ == "__main__":
     main()